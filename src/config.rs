@@ -24,6 +24,8 @@ pub struct SerialConfig {
     pub port: String,
     pub baudrate: u32,
     pub timeout_ms: u64,
+    #[serde(default = "default_low_latency")]
+    pub low_latency: bool,
 }
 
 #[derive(Debug, Deserialize)]
@@ -73,6 +75,10 @@ pub struct BashStepConfig {
     pub wait_for_signal: bool,
 }
 
+fn default_low_latency() -> bool {
+    true
+}
+
 fn default_wait_for_signal() -> bool {
     true
 }
@@ -6,6 +6,7 @@ use log::{debug, error};
 use std::fmt;
 use std::io::{self, BufRead, Write};
 use std::sync::atomic::{AtomicBool, Ordering};
+use std::time::Duration;
 use std::{sync::Arc, thread};
 
 use crossbeam::channel;
@@ -13,6 +14,8 @@ use crossbeam::channel;
 use command::Command;
 use message::{Message, Push, Response};
 
+const SEND_IDLE_TIMEOUT: Duration = Duration::from_millis(100);
+
 #[derive(Debug)]
 pub enum ControllerError {
     ParseError { message: String, input: String },
@@ -82,14 +85,16 @@ impl Controller {
                 command: Command,
                 verbose: bool,
             ) {
-                if verbose {
-                    debug!("Serial (SND) > {}", command);
-                }
+                // Render the trace up front but only emit it once the bytes are on the wire, so
+                // logger I/O never delays the write
+                let trace = verbose.then(|| command.to_string());
 
                 match command {
                     Command::Gcode(gcode) => {
+                        // Both writes land in the BufWriter and go out in a single flush
                         let _ = writer
-                            .write_all(format!("{}\n", gcode).as_bytes())
+                            .write_all(gcode.as_bytes())
+                            .and_then(|_| writer.write_all(b"\n"))
                             .or_else(log_err);
                     }
                     Command::Realtime(byte) => {
@@ -98,28 +103,56 @@ impl Controller {
                 }
 
                 let _ = writer.flush().or_else(log_err);
+
+                if let Some(trace) = trace {
+                    debug!("Serial (SND) > {}", trace);
+                }
             }
 
+            let mut select = channel::Select::new();
+            select.recv(&prio_send_rx);
+            select.recv(&send_rx);
+
             while send_running.load(Ordering::Relaxed) {
+                // Drain priority commands first so realtime bytes never wait behind G-code
                 if let Ok(command) = prio_send_rx.try_recv() {
                     send(&mut writer, command, verbose_logging);
+                    continue;
                 }
 
                 if let Ok(command) = send_rx.try_recv() {
                     send(&mut writer, command, verbose_logging);
+                    continue;
                 }
+
+                // Park until a command is pending rather than spinning on try_recv, waking
+                // periodically to observe shutdown
+                let _ = select.ready_timeout(SEND_IDLE_TIMEOUT);
             }
         });
 
         let recv_handle = thread::spawn(move || {
+            let mut response = String::new();
+
             while recv_running.load(Ordering::Relaxed) {
-                let mut response = String::new();
-                let _ = reader.read_line(&mut response).or_else(log_err);
+                // Reads already sleep in poll(2) on the port until data arrives, so a timeout
+                // only means the line is incomplete. Keep the partial line and read again
+                match reader.read_line(&mut response) {
+                    Ok(_) if response.ends_with('\n') => {}
+                    Ok(_) => continue,
+                    Err(error) if error.kind() == io::ErrorKind::TimedOut => continue,
+                    Err(error) => {
+                        error!("{}", error);
+                        response.clear();
+                        continue;
+                    }
+                }
+
                 let message = Message::from(response.trim());
+                response.clear();
 
-                if verbose_logging {
-                    debug!("Serial (RECV) < {}", message);
-                }
+                // As above, hand the message off before spending time on logger I/O
+                let trace = verbose_logging.then(|| message.to_string());
 
                 match message {
                     Message::Push(push) => {
@@ -128,7 +161,11 @@ impl Controller {
                     Message::Response(res) => {
                         recv_tx.send(res).unwrap();
                     }
-                    _ => continue,
+                    Message::Unknown(_) => {}
+                }
+
+                if let Some(trace) = trace {
+                    debug!("Serial (RECV) < {}", trace);
                 }
             }
         });
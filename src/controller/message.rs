@@ -1,7 +1,5 @@
 use std::fmt;
 
-use regex::Regex;
-
 use super::ControllerError;
 
 pub enum Message {
@@ -22,13 +20,15 @@ impl fmt::Display for Message {
 
 impl From<&str> for Message {
     fn from(value: &str) -> Self {
-        if let Ok(response) = Response::try_from(value) {
-            Message::Response(response)
-        } else if let Ok(push) = Push::try_from(value) {
-            Message::Push(push)
+        // Realtime reports always start with '<', so dispatch on that instead of building a
+        // throwaway parse error for every report that is first tried as a response
+        let message = if value.starts_with('<') {
+            Push::try_from(value).map(Message::Push)
         } else {
-            Message::Unknown(value.to_string())
-        }
+            Response::try_from(value).map(Message::Response)
+        };
+
+        message.unwrap_or_else(|_| Message::Unknown(value.to_string()))
     }
 }
 
@@ -64,39 +64,18 @@ impl TryFrom<&str> for Response {
                 input: value.to_string(),
             })?;
             Ok(Response::Error(error_code))
-        } else if value.starts_with("[PRB:") {
-            let regex = Regex::new(r"^\[PRB:([+-]?\d+\.\d+),([+-]?\d+\.\d+),([+-]?\d+\.\d+),([+-]?\d+\.\d+),([+-]?\d+\.\d+):([01])\]$").unwrap();
-
-            if let Some(captures) = regex.captures(value) {
-                let x = captures[1]
-                    .parse::<f64>()
-                    .map_err(|_| ControllerError::ParseError {
-                        message: "Invalid X coordinate".to_string(),
-                        input: value.to_string(),
-                    })?;
-                let y = captures[2]
-                    .parse::<f64>()
-                    .map_err(|_| ControllerError::ParseError {
-                        message: "Invalid Y coordinate".to_string(),
-                        input: value.to_string(),
-                    })?;
-                let z = captures[3]
-                    .parse::<f64>()
-                    .map_err(|_| ControllerError::ParseError {
-                        message: "Invalid Z coordinate".to_string(),
-                        input: value.to_string(),
-                    })?;
-
-                Ok(Response::Probe {
-                    raw: value.to_string(),
-                    coords: (x, y, z),
-                })
-            } else {
-                Err(ControllerError::ParseError {
+        } else if let Some(probe) = value.strip_prefix("[PRB:") {
+            let Some([x, y, z, ..]) = parse_probe(probe) else {
+                return Err(ControllerError::ParseError {
                     message: "Invalid probe response format".to_string(),
                     input: value.to_string(),
-                })
-            }
+                });
+            };
+
+            Ok(Response::Probe {
+                raw: value.to_string(),
+                coords: (x, y, z),
+            })
         } else {
             Err(ControllerError::ParseError {
                 message: "Not a valid response".to_string(),
@@ -106,6 +85,37 @@ impl TryFrom<&str> for Response {
     }
 }
 
+// Parses the body of `[PRB:x,y,z,a,b:success]`, accepting the same `[+-]?\d+\.\d+`
+// coordinates Grbl reports
+fn parse_probe(probe: &str) -> Option<[f64; 5]> {
+    let (coords, success) = probe.strip_suffix(']')?.rsplit_once(':')?;
+    if !matches!(success, "0" | "1") {
+        return None;
+    }
+
+    let mut axes = coords.split(',');
+    let mut parsed = [0.0; 5];
+    for coord in &mut parsed {
+        *coord = axes
+            .next()
+            .filter(|axis| is_coordinate(axis))?
+            .parse()
+            .ok()?;
+    }
+
+    axes.next().is_none().then_some(parsed)
+}
+
+fn is_coordinate(value: &str) -> bool {
+    let unsigned = value.strip_prefix(['+', '-']).unwrap_or(value);
+
+    unsigned.split_once('.').is_some_and(|(int, frac)| {
+        !int.is_empty()
+            && !frac.is_empty()
+            && int.bytes().chain(frac.bytes()).all(|b| b.is_ascii_digit())
+    })
+}
+
 pub enum Push {
     Report(Report),
 }
@@ -156,43 +166,42 @@ impl TryFrom<&str> for Report {
     type Error = ControllerError;
 
     fn try_from(value: &str) -> Result<Self, Self::Error> {
-        let regex = Regex::new(r"^<([A-Za-z]+)(\|[^>]*)*>$").unwrap();
-        if !regex.is_match(&value) {
-            return Err(ControllerError::ParseError {
-                message: "Not a valid realtime report".to_string(),
-                input: value.to_string(),
-            });
-        }
+        let invalid = || ControllerError::ParseError {
+            message: "Not a valid realtime report".to_string(),
+            input: value.to_string(),
+        };
 
-        let content = value.strip_prefix("<").unwrap().strip_suffix(">").unwrap();
-        let parts: Vec<&str> = content.split("|").collect();
+        // Validate and split in a single pass over the report: `<State|Field:...|...>`
+        let content = value
+            .strip_prefix('<')
+            .and_then(|content| content.strip_suffix('>'))
+            .filter(|content| !content.contains('>'))
+            .ok_or_else(invalid)?;
+        let mut parts = content.split('|');
+        let state = parts
+            .next()
+            .filter(|state| !state.is_empty() && state.bytes().all(|b| b.is_ascii_alphabetic()))
+            .ok_or_else(invalid)?;
 
         let mut report = Report {
             raw: value.to_string(),
-            status: Some(Status::from(parts[0])),
+            status: Some(Status::from(state)),
             mpos: None,
             bf: None,
         };
 
-        for part in &parts[1..] {
+        for part in parts {
             if let Some(pos_str) = part.strip_prefix("MPos:") {
                 // Machine position: MPos:0.000,0.000,0.000
-                let coords: Vec<&str> = pos_str.split(",").collect();
-                if coords.len() >= 3 {
-                    report.mpos = Some((
-                        coords[0].parse().unwrap_or(0.0),
-                        coords[1].parse().unwrap_or(0.0),
-                        coords[2].parse().unwrap_or(0.0),
-                    ));
+                let mut coords = pos_str.split(',').map(|coord| coord.parse().unwrap_or(0.0));
+                if let (Some(x), Some(y), Some(z)) = (coords.next(), coords.next(), coords.next()) {
+                    report.mpos = Some((x, y, z));
                 }
             } else if let Some(buf_str) = part.strip_prefix("Bf:") {
                 // Buffer state: Bf:15,128
-                let buf_parts: Vec<&str> = buf_str.split(",").collect();
-                if buf_parts.len() >= 2 {
-                    report.bf = Some((
-                        buf_parts[0].parse().unwrap_or(0),
-                        buf_parts[1].parse().unwrap_or(0),
-                    ));
+                let mut buf_parts = buf_str.split(',').map(|count| count.parse().unwrap_or(0));
+                if let (Some(blocks), Some(bytes)) = (buf_parts.next(), buf_parts.next()) {
+                    report.bf = Some((blocks, bytes));
                 }
             }
         }
@@ -1,15 +1,73 @@
 use std::collections::VecDeque;
+use std::io;
+use std::os::unix::io::AsRawFd;
 use std::sync::Arc;
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::thread;
 use std::time::Duration;
 
 use log::error;
+use serialport::TTYPort;
 
 use super::command::Command;
 use super::message::{Push, Report, Response};
 use super::{Controller, ControllerError};
 
+// Mirrors `struct serial_struct` from linux/serial.h
+#[cfg(target_os = "linux")]
+#[repr(C)]
+struct SerialStruct {
+    kind: libc::c_int,
+    line: libc::c_int,
+    port: libc::c_uint,
+    irq: libc::c_int,
+    flags: libc::c_int,
+    xmit_fifo_size: libc::c_int,
+    custom_divisor: libc::c_int,
+    baud_base: libc::c_int,
+    close_delay: libc::c_ushort,
+    io_type: libc::c_char,
+    reserved_char: [libc::c_char; 1],
+    hub6: libc::c_int,
+    closing_wait: libc::c_ushort,
+    closing_wait2: libc::c_ushort,
+    iomem_base: *mut libc::c_uchar,
+    iomem_reg_shift: libc::c_ushort,
+    port_high: libc::c_uint,
+    iomap_base: libc::c_ulong,
+}
+
+#[cfg(target_os = "linux")]
+const ASYNC_LOW_LATENCY: libc::c_int = 1 << 13;
+
+/// Sets ASYNC_LOW_LATENCY on the port so USB serial adapters (e.g. FTDI) flush received
+/// bytes immediately instead of batching them on their latency timer (16ms by default).
+#[cfg(target_os = "linux")]
+pub fn set_low_latency(serial: &TTYPort) -> io::Result<()> {
+    let fd = serial.as_raw_fd();
+
+    // SAFETY: `info` matches the kernel's serial_struct layout and outlives both calls
+    let mut info: SerialStruct = unsafe { std::mem::zeroed() };
+    if unsafe { libc::ioctl(fd, libc::TIOCGSERIAL, &mut info) } < 0 {
+        return Err(io::Error::last_os_error());
+    }
+
+    info.flags |= ASYNC_LOW_LATENCY;
+    if unsafe { libc::ioctl(fd, libc::TIOCSSERIAL, &info) } < 0 {
+        return Err(io::Error::last_os_error());
+    }
+
+    Ok(())
+}
+
+#[cfg(not(target_os = "linux"))]
+pub fn set_low_latency(_serial: &TTYPort) -> io::Result<()> {
+    Err(io::Error::new(
+        io::ErrorKind::Unsupported,
+        "Low latency mode is only supported on Linux",
+    ))
+}
+
 pub fn wait_for_report<F: Fn(&Report) -> bool>(
     controller: &Controller,
     predicate: Option<F>,
@@ -71,37 +129,50 @@ pub fn buffered_stream(
     };
 
     let mut queued_bytes = VecDeque::new();
-    let mut responses = Vec::new();
+    let mut queued_total = 0;
+    // Every line gets at least an `ok`/`error`, so size for that up front
+    let mut responses = Vec::with_capacity(gcode.len());
 
     let mut sent = 0;
     let mut received = 0;
 
-    let mut receive =
-        |received: &mut i32, queued_bytes: &mut VecDeque<usize>| -> Result<(), ControllerError> {
-            let response = serial_rx.recv().map_err(|error| {
-                ControllerError::SerialError(format!("Failed to wait for response: {}", error))
-            })?;
-
-            if let Response::Ok | Response::Error(_) = response {
-                queued_bytes.pop_front();
-                *received += 1;
+    let mut receive = |received: &mut i32,
+                       queued_bytes: &mut VecDeque<usize>,
+                       queued_total: &mut usize|
+     -> Result<(), ControllerError> {
+        let response = serial_rx.recv().map_err(|error| {
+            ControllerError::SerialError(format!("Failed to wait for response: {}", error))
+        })?;
+
+        if let Response::Ok | Response::Error(_) = response {
+            if let Some(bytes) = queued_bytes.pop_front() {
+                *queued_total -= bytes;
             }
+            *received += 1;
+        }
 
-            responses.push((*received, response));
+        responses.push((*received, response));
 
-            Ok(())
-        };
+        Ok(())
+    };
 
     for raw_line in gcode {
         let line = raw_line.trim();
+        let line_bytes = line.len() + 1;
+
+        // Wait for room in the RX buffer. Only lines already in flight can free space, so a
+        // line that alone exceeds the buffer is sent once the queue is empty rather than
+        // blocking forever on a response that will never come
+        while !queued_bytes.is_empty()
+            && queued_total + line_bytes >= rx_buffer_size.saturating_sub(1)
+        {
+            receive(&mut received, &mut queued_bytes, &mut queued_total)?;
+        }
 
-        queued_bytes.push_back(line.len() + 1);
+        queued_bytes.push_back(line_bytes);
+        queued_total += line_bytes;
         sent += 1;
 
-        while queued_bytes.iter().sum::<usize>() >= rx_buffer_size - 1 {
-            receive(&mut received, &mut queued_bytes)?;
-        }
-
         serial_tx
             .send(Command::Gcode(line.to_string()))
             .map_err(|error| {
@@ -110,7 +181,7 @@ pub fn buffered_stream(
     }
 
     while sent > received {
-        receive(&mut received, &mut queued_bytes)?;
+        receive(&mut received, &mut queued_bytes, &mut queued_total)?;
     }
 
     Ok(responses)
@@ -15,6 +15,9 @@ use simplelog::*;
 
 use config::{CncConfig, apply_template, expand_path};
 use controller::Controller;
+use controller::serial::set_low_latency;
+
+const TIMESTAMP_FORMAT: &str = "%Y%m%d_%H%M%S";
 
 struct GpioInputs {
     signal: InputPin,
@@ -36,7 +39,7 @@ fn setup_logging(config: &CncConfig) -> Result<(), Box<dyn std::error::Error>> {
     };
 
     if config.logs.save {
-        let timestamp = Local::now().format("%Y%m%d_%H%M%S").to_string();
+        let timestamp = Local::now().format(TIMESTAMP_FORMAT).to_string();
 
         let expanded_path = expand_path(&config.logs.path);
         let templated_path = apply_template(&expanded_path, &timestamp);
@@ -75,20 +78,24 @@ fn main() -> Result<(), String> {
 
     setup_logging(&config).map_err(|error| format!("Failed to setup logging: {}", error))?;
 
-    let config =
-        CncConfig::load().map_err(|error| format!("Failed to load configuration: {}", error))?;
-
     let serial = serialport::new(&config.serial.port, config.serial.baudrate)
         .timeout(Duration::from_millis(config.serial.timeout_ms))
-        .open()
+        .open_native()
         .map_err(|error| format!("Failed to open serial connection: {}", error))?;
+
+    if config.serial.low_latency {
+        if let Err(error) = set_low_latency(&serial) {
+            warn!("Failed to enable serial low latency mode: {}", error);
+        }
+    }
+
     let mut serial_clone = serial
-        .try_clone()
+        .try_clone_native()
         .map_err(|error| format!("Failed to clone serial connection: {}", error))?;
 
     let mut controller = Controller::new();
     let controller_running = controller.running.clone();
-    controller.start(serial, config.logs.verbose);
+    controller.start(Box::new(serial), config.logs.verbose);
 
     ctrlc::set_handler(move || {
         warn!("Shutting down...");
@@ -114,7 +121,7 @@ fn main() -> Result<(), String> {
         .map_err(|error| format!("Failed to set signal interrupt: {}", error))?;
 
     while controller.running.load(Ordering::Relaxed) {
-        let timestamp = Local::now().format("%Y%m%d_%H%M%S").to_string();
+        let timestamp = Local::now().format(TIMESTAMP_FORMAT).to_string();
 
         for (i, step) in config.steps.iter().enumerate() {
             if i == 0 || step.should_wait() {
@@ -1,14 +1,30 @@
-use std::fs::File;
-use std::io::{BufRead, BufReader, BufWriter, Write};
+use std::fs::{self, File};
+use std::io::{BufWriter, Write};
 
 use log::{error, info, warn};
 
 use crate::config::{GcodeStepConfig, ProbeConfig, apply_template, expand_path};
-use crate::controller::command::Command;
 use crate::controller::message::{Report, Response, Status};
 use crate::controller::serial::{buffered_stream, wait_for_report};
 use crate::controller::{Controller, ControllerError};
 
+const CHECK_MODE_TOGGLE: &str = "$C";
+
+fn toggle_check_mode(
+    controller: &Controller,
+    rx_buffer_size: usize,
+) -> Result<(), ControllerError> {
+    let responses = buffered_stream(controller, vec![CHECK_MODE_TOGGLE], rx_buffer_size)?;
+
+    match responses
+        .into_iter()
+        .find(|(_, res)| matches!(res, Response::Error(_)))
+    {
+        Some((line_number, error)) => Err(ControllerError::GcodeError(line_number, error)),
+        None => Ok(()),
+    }
+}
+
 pub fn execute_gcode_step(
     step: &GcodeStepConfig,
     controller: &Controller,
@@ -18,16 +34,19 @@ pub fn execute_gcode_step(
     let expanded_path = expand_path(&step.path);
     let templated_path = apply_template(&expanded_path, timestamp);
 
-    let file = File::open(&templated_path)
-        .map_err(|error| format!("Failed to open G-code file '{}': {}", templated_path, error))?;
-    let reader = BufReader::new(file);
+    // Read the program in one go and borrow lines from it rather than allocating per line
+    let gcode_source = fs::read_to_string(&templated_path)
+        .map_err(|error| format!("Failed to read G-code file '{}': {}", templated_path, error))?;
 
-    let gcode_lines: Vec<String> = reader
+    // Prepare the program once for both the check and streaming passes. Blank lines are dropped
+    // since Grbl would spend a full `ok` round-trip on each; file line numbers are kept so
+    // errors still point at the right line
+    let (line_numbers, gcode): (Vec<i32>, Vec<&str>) = gcode_source
         .lines()
-        .collect::<Result<Vec<_>, _>>()
-        .map_err(|error| format!("Failed to read G-code file: {}", error))?;
-
-    let gcode: Vec<&str> = gcode_lines.iter().map(|s| s.as_str()).collect();
+        .zip(1..)
+        .map(|(line, line_number)| (line_number, line.trim()))
+        .filter(|(_, line)| !line.is_empty())
+        .unzip();
 
     let output_writer = if let Some(ProbeConfig {
         save_path: Some(save_path),
@@ -55,11 +74,8 @@ pub fn execute_gcode_step(
     if step.check {
         info!("Checking G-code");
 
-        if let Some((serial_tx, _)) = controller.serial_channel.clone() {
-            serial_tx
-                .send(Command::Gcode("$C".to_string()))
-                .map_err(|error| format!("Failed to enable check mode: {}", error))?;
-        }
+        toggle_check_mode(controller, rx_buffer_size)
+            .map_err(|error| format!("Failed to enable check mode: {}", error))?;
 
         let errors: Vec<ControllerError> =
             buffered_stream(controller, gcode.clone(), rx_buffer_size)
@@ -67,28 +83,26 @@ pub fn execute_gcode_step(
                 .iter()
                 .filter_map(|res| {
                     if let Response::Error(_) = res.1 {
-                        Some(ControllerError::GcodeError(res.0, res.1.clone()))
+                        let line_number = line_numbers[res.0 as usize - 1];
+                        Some(ControllerError::GcodeError(line_number, res.1.clone()))
                     } else {
                         None
                     }
                 })
                 .collect();
 
-        if let Some((serial_tx, _)) = controller.serial_channel.clone() {
-            serial_tx
-                .send(Command::Gcode("$C".to_string()))
-                .map_err(|error| format!("Failed to disable check mode: {}", error))?;
-        }
+        toggle_check_mode(controller, rx_buffer_size)
+            .map_err(|error| format!("Failed to disable check mode: {}", error))?;
 
         if errors.len() > 0 {
             error!(
                 "Checking complete! {} errors found:\n
                  {}\n",
                 errors.len(),
-                errors.iter().fold(String::new(), |res, err| format!(
-                    "{}\n                 {}",
-                    res, err
-                )),
+                errors
+                    .iter()
+                    .map(|err| format!("\n                 {}", err))
+                    .collect::<String>(),
             );
             warn!("Skipping streaming");
 
@@ -106,15 +120,19 @@ pub fn execute_gcode_step(
     if let Some(mut writer) = output_writer {
         writeln!(writer, "x,y,z")?;
 
-        responses
-            .iter()
-            .try_for_each(|res| -> std::io::Result<()> {
-                if let Response::Probe { coords, .. } = res.1 {
-                    writeln!(writer, "{},{},{}", coords.0, coords.1, coords.2)?;
-                }
+        for (_, response) in &responses {
+            if let Response::Probe {
+                coords: (x, y, z), ..
+            } = response
+            {
+                writeln!(writer, "{},{},{}", x, y, z)?;
+            }
+        }
 
-                Ok(())
-            })?;
+        // Flush explicitly, dropping a BufWriter silently discards any write error
+        writer
+            .flush()
+            .map_err(|error| format!("Failed to write probe points: {}", error))?;
     }
 
     wait_for_report(